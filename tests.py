@@ -2,7 +2,10 @@ from collections import namedtuple
 from dataclasses import dataclass
 import operator as ops
 import re
+import sys
+import tracemalloc
 from typing import Any, NamedTuple
+import weakref
 
 import pytest
 
@@ -66,41 +69,45 @@ OuterUntypedNT = namedtuple('OuterUntypedNT', ['val1', 'val2'])
     (uc.const(5), 0, 5),
     (uc.const(5), 1, 5),
     # itemgetter
-    (r_item1, 3, TypeError('not subscriptable')),
-    (r_item1, [], IndexError('out of range')),
     (r_item1, [1, 2, 3], 2),
-    (uc.itemgetter('key'), {}, KeyError('key')),
     (uc.itemgetter('key'), {'key': 3}, 3),
     # attrgetter
-    (r_attr, 3, AttributeError("'int' object has no attribute 'attr'")),
-    (r_attr_typed, 3, AttributeError("'int' object has no attribute 'attr'")),
     (r_attr, Obj(3), 3),
     (r_attr_typed, Obj(3), 3),
-    (uc.attrgetter('fake'), Obj(3), AttributeError("'Obj' object has no attribute 'fake'")),
     (uc.attrgetter('attr.attr'), Obj(Obj(3)), 3),
-    (uc.attrgetter('fake', type=Outer), Outer(Obj(3)), AttributeError("'Outer' object has no attribute 'fake'")),
     (uc.attrgetter('val1.attr', type=Outer), Outer(Obj(3)), 3),
-    (uc.attrgetter('val1.fake', type=Outer), Outer(Obj(3)), AttributeError("'Obj' object has no attribute 'fake'")),
     (uc.attrgetter('val1.attr', type=OuterDC), OuterDC(Obj(3), 1), 3),
-    (uc.attrgetter('val2.attr', type=OuterDC), OuterDC(Obj(3), 1), AttributeError("'int' object has no attribute 'attr'")),
     (uc.attrgetter('val1.attr', type=OuterTypedNT), OuterDC(Obj(3), 1), 3),
     (uc.attrgetter('val1.attr', type=OuterUntypedNT), OuterDC(Obj(3), 1), 3),
-    (uc.attrgetter('val1.fake', type=OuterUntypedNT), OuterDC(Obj(3), 1), AttributeError("'Obj' object has no attribute 'fake'")),
     # make_tuple
     (uc.make_tuple(uc.const(1)), 0, (1,)),
     (uc.make_tuple(uc.const(1), uc.const(2)), 0, (1, 2)),
+    (uc.make_tuple(uc.const(1), r_square, uc.const(2)), 3, (1, 9, 2)),
+    (uc.make_tuple(r_id, r_square), 3, (3, 9)),
+    (uc.make_tuple(r_id, r_square, r_add_one, r_id), 2, (2, 4, 3, 2)),
+    (uc.make_tuple(r_square, r_add_one, r_id), 3, (9, 4, 3)),
     # map
     (r_square.map(add_one), 3, 10),
     (uc.map(add_one, r_square), 3, 10),
     (r_add_one.map(square), 3, 16),
     (uc.map(square, r_add_one), 3, 16),
     (uc.const(5).map(square), 0, 25),
+    (r_square.map(add_one).map(square), 3, 100),
+    (r_square.map(add_one).map(square).map(str), 3, '100'),
+    (uc.map(str, uc.map(square, uc.map(add_one, r_square))), 3, '100'),
     # map_binary
     (r_add_one.map_binary(ops.add, r_square), 3, 13),
+    (r_square.map_binary(ops.sub, uc.const(1)), 3, 8),
+    (uc.const(1).map_binary(ops.sub, r_square), 3, -8),
+    (uc.const(1).map_binary(ops.sub, uc.const(3)), None, -2),
     # arithmetic operators
     (-r_square, 3, -9),
     (+r_square, 3, 9),
     (~r_square, 3, -10),
+    (-uc.const(3), None, -3),
+    (~uc.const(3), None, -4),
+    (-(~r_square), 3, 10),
+    (-r_square.map(add_one), 3, -10),
     (r_square + r_add_one, 3, 13),
     (r_square - r_add_one, 3, 5),
     (r_square * r_add_one, 3, 36),
@@ -118,6 +125,9 @@ OuterUntypedNT = namedtuple('OuterUntypedNT', ['val1', 'val2'])
     (r_id.falsy(), False, True),
     (r_not.falsy(), True, True),
     (r_not.falsy(), False, False),
+    (r_id.truthy(), [], False),
+    (r_id.truthy(), [0], True),
+    (r_id.truthy().falsy(), [0], False),
     (uc.const(3) & uc.const(2), 0, 2),
     (uc.const(3) and uc.const(2), 0, 2),
     (uc.const(True) & uc.const(False), 0, False),
@@ -149,67 +159,204 @@ OuterUntypedNT = namedtuple('OuterUntypedNT', ['val1', 'val2'])
     (r_square.equals(r_id), 3, False),
     (r_square.not_equals(r_square), 3, False),
     (r_square.not_equals(r_id), 3, True),
+    (r_square.map_binary(ops.ne, r_id), 3, True),
+    (r_id < uc.const(5), 3, True),
+    (uc.const(5) < r_id, 3, False),
+    (r_id.map_binary(min, r_square), 3, 3),
     # other operators
-    (r_id.contains('a'), 3, TypeError('not iterable')),
     (r_id.contains('a'), 'abc', True),
     (r_id.contains('a'), 'bc', False),
     (r_id.contains('a'), ['a'], True),
     (r_id.contains('a'), ['ab'], False),
-    (r_id.getitem(0), 3, TypeError('not subscriptable')),
-    (r_id.getitem(0), [], IndexError('out of range')),
     (r_id.getitem(0), [1, 2, 3], 1),
-    (r_id.getitem(slice(None, 2)), 3, TypeError('not subscriptable')),
     (r_id.getitem(slice(None, 2)), [], []),
     (r_id.getitem(slice(None, 2)), [1, 2, 3], [1, 2]),
-    (r_id.getitem('key'), 3, TypeError('not subscriptable')),
-    (r_id.getitem('key'), [], TypeError('list indices must be integers or slices')),
-    (r_id.getitem('key'), {}, KeyError('key')),
     (r_id.getitem('key'), {'key': 'val'}, 'val'),
-    (r_id.getattr('attr'), 3, AttributeError("'int' object has no attribute 'attr'")),
+    (uc.const([1, 2]).getitem(1), None, 2),
+    (uc.const('abc').contains('b'), None, True),
+    (r_id.getitem(0).contains('a'), ['abc'], True),
     (r_id.getattr('attr'), Obj(3), 3),
     (r_id.getattr('attr', None), Obj(3), 3),
     (r_id.getattr('other', None), Obj(3), None),
     (r_id.getattr('attr'), Obj(Obj(3)), Obj(3)),
-    (r_id.getattr('attr').getattr('attr'), Obj(3), AttributeError("'int' object has no attribute 'attr'")),
     (r_id.getattr('attr').getattr('attr'), Obj(Obj(3)), 3),
-    (r_id.getattr('attr.attr'), 3, AttributeError("'int' object has no attribute 'attr'")),
-    (r_id.getattr('attr.attr'), Obj(3), AttributeError("'int' object has no attribute 'attr'")),
     (r_id.getattr('attr.attr'), Obj(Obj(3)), 3),
     (r_id.getattr('attr.attr', None), 3, None),
     (r_id.getattr('attr.attr', None), Obj(3), None),
     (r_id.getattr('attr.attr', None), Obj(Obj(3)), 3),
     # reductions
+    (uc.reduce([], ops.sub, initial=100), None, 100),
+    (uc.reduce([r_square], ops.sub), 3, 9),
+    (uc.reduce([r_id, r_square], ops.sub), 3, -6),
+    (uc.reduce([r_id, r_square], ops.sub, initial=100), 3, 88),
+    (uc.reduce([uc.const(2), uc.const(3), r_id], ops.pow), 2, 64),
+    (uc.reduce([r_id] * 100, ops.add), 1, 100),
+    (uc.reduce((r for r in [r_id, r_square]), ops.sub), 3, -6),
+    (uc.sum(iter([uc.const(1), uc.const(2)])), None, 3),
+    (uc.reduce([r_id] * 100, ops.add, initial=5), 1, 105),
+    (uc.reduce([r_id, r_square], ops.lt), 3, True),
+    (uc.reduce([r_square, r_id], ops.lt), 3, False),
     (uc.all([]), False, True),
     (uc.all([]), True, True),
     (uc.all([r_id, r_id, r_id]), False, False),
     (uc.all([r_id, r_id, r_id]), True, True),
     (uc.all([r_id, r_not, r_id]), False, False),
     (uc.all([r_id, r_not, r_id]), True, False),
+    (uc.all([r_id, r_item1]), 0, False),
+    (uc.all([uc.const(3), uc.const(2)]), None, True),
     (uc.any([]), False, False),
     (uc.any([]), True, False),
     (uc.any([r_id, r_id, r_id]), False, False),
     (uc.any([r_id, r_id, r_id]), True, True),
     (uc.any([r_id, r_not, r_id]), False, True),
     (uc.any([r_id, r_not, r_id]), True, True),
-    (uc.sum([]), None, TypeError('no initial value')),
+    (uc.any([r_id, r_item1]), 3, True),
+    (uc.any([uc.const(0), uc.const([])]), None, False),
     (uc.sum([r_id, r_square, r_add_one]), 3, 16),
-    (uc.sum([uc.const(1), uc.const('2')]), None, TypeError('unsupported operand type')),
     (uc.sum([uc.const('1'), uc.const('2')]), None, '12'),
     (uc.sum([uc.const([1]), uc.const([]), uc.const([2])]), None, [1, 2]),
-    (uc.prod([]), None, TypeError('no initial value')),
     (uc.prod([r_id, r_square, r_add_one]), 3, 108),
-    (uc.min([]), None, TypeError('no initial value')),
     (uc.min([r_id, r_square, r_add_one]), 3, 3),
-    (uc.max([]), None, TypeError('no initial value')),
     (uc.max([r_id, r_square, r_add_one]), 3, 9),
 ])
-def test_reader(reader, input_val, output_val):
+def test_reader_ok(reader, input_val, output_val):
     """Tests that a (reader, input) pair produces what we expect."""
-    if isinstance(output_val, Exception):  # expect an error
-        with pytest.raises(type(output_val), match=str(output_val)):
-            _ = reader(input_val)
-    else:
-        assert reader(input_val) == output_val
+    assert reader(input_val) == output_val
+    assert reader.compile()(input_val) == output_val
+
+@pytest.mark.parametrize(['reader', 'input_val', 'error'], [
+    # itemgetter
+    (r_item1, 3, TypeError('not subscriptable')),
+    (r_item1, [], IndexError('out of range')),
+    (uc.itemgetter('key'), {}, KeyError('key')),
+    # attrgetter
+    (r_attr, 3, AttributeError("'int' object has no attribute 'attr'")),
+    (r_attr_typed, 3, AttributeError("'int' object has no attribute 'attr'")),
+    (uc.attrgetter('fake'), Obj(3), AttributeError("'Obj' object has no attribute 'fake'")),
+    (uc.attrgetter('fake', type=Outer), Outer(Obj(3)), AttributeError("'Outer' object has no attribute 'fake'")),
+    (uc.attrgetter('val1.fake', type=Outer), Outer(Obj(3)), AttributeError("'Obj' object has no attribute 'fake'")),
+    (uc.attrgetter('val2.attr', type=OuterDC), OuterDC(Obj(3), 1), AttributeError("'int' object has no attribute 'attr'")),
+    (uc.attrgetter('val1.fake', type=OuterUntypedNT), OuterDC(Obj(3), 1), AttributeError("'Obj' object has no attribute 'fake'")),
+    # make_tuple
+    (uc.make_tuple(r_id, r_item1), 3, TypeError('not subscriptable')),
+    # map
+    (uc.const(0).map(lambda x: 1 / x), None, ZeroDivisionError('division by zero')),
+    # map_binary
+    (uc.const(1).map_binary(ops.truediv, uc.const(0)), None, ZeroDivisionError('division by zero')),
+    # arithmetic operators
+    (-r_id, 'a', TypeError('bad operand type')),
+    # comparison operators
+    (r_id < r_square, 'a', TypeError('unsupported operand type')),
+    # other operators
+    (r_id.contains('a'), 3, TypeError('not iterable')),
+    (r_id.getitem(0), 3, TypeError('not subscriptable')),
+    (r_id.getitem(0), [], IndexError('out of range')),
+    (r_id.getitem(slice(None, 2)), 3, TypeError('not subscriptable')),
+    (r_id.getitem('key'), 3, TypeError('not subscriptable')),
+    (r_id.getitem('key'), [], TypeError('list indices must be integers or slices')),
+    (r_id.getitem('key'), {}, KeyError('key')),
+    (r_square.getitem(0), 3, TypeError('not subscriptable')),
+    (uc.const([1, 2]).getitem(2), None, IndexError('out of range')),
+    (r_id.getattr('attr'), 3, AttributeError("'int' object has no attribute 'attr'")),
+    (r_id.getattr('attr').getattr('attr'), Obj(3), AttributeError("'int' object has no attribute 'attr'")),
+    (r_id.getattr('attr.attr'), 3, AttributeError("'int' object has no attribute 'attr'")),
+    (r_id.getattr('attr.attr'), Obj(3), AttributeError("'int' object has no attribute 'attr'")),
+    # reductions
+    (uc.reduce([], ops.sub), None, TypeError('no initial value')),
+    (uc.reduce([r_id, r_item1], ops.add), 3, TypeError('not subscriptable')),
+    (uc.all([r_id, r_item1]), 3, TypeError('not subscriptable')),
+    (uc.any([r_id, r_item1]), 0, TypeError('not subscriptable')),
+    (uc.sum([]), None, TypeError('no initial value')),
+    (uc.sum([uc.const(1), uc.const('2')]), None, TypeError('unsupported operand type')),
+    (uc.prod([]), None, TypeError('no initial value')),
+    (uc.min([]), None, TypeError('no initial value')),
+    (uc.max([]), None, TypeError('no initial value')),
+])
+def test_reader_raises(reader, input_val, error):
+    """Tests that a (reader, input) pair raises the error we expect."""
+    with pytest.raises(type(error), match=str(error)):
+        _ = reader(input_val)
+    with pytest.raises(type(error), match=str(error)):
+        _ = reader.compile()(input_val)
+
+def test_batch():
+    """Tests calling a Reader on multiple inputs."""
+    assert r_square.batch([]) == []
+    assert r_square.batch([1, 2, 3]) == [1, 4, 9]
+    assert (r_square + r_add_one).batch(range(3)) == [1, 3, 7]
+    assert uc.const(5).batch('abc') == [5, 5, 5]
+    with pytest.raises(TypeError, match='not subscriptable'):
+        _ = r_item1.batch([[1, 2], 3])
+
+def test_compile():
+    """Tests that compiling a Reader evaluates each distinct sub-Reader once per call."""
+    calls = []
+    def func(x):
+        calls.append(x)
+        return x + 1
+    r = Reader(func)
+    reader = (r + r * r).map(str).compile()
+    assert reader(2) == '12'
+    assert calls == [2]
+    # deep trees are evaluated in a single generated function
+    nested = r_id
+    for i in range(200):
+        nested = -(nested + uc.const(i))
+    assert nested.compile()(0) == nested(0) == -100
+    # trees deeper than the recursion limit can be compiled
+    depth = sys.getrecursionlimit() + 1000
+    deep = r_id
+    for _ in range(depth):
+        deep = deep + uc.const(1)
+    assert deep.compile()(0) == deep(0) == depth
+    # ...even when the uncompiled Reader is too deep to call
+    deep = r_id
+    for _ in range(depth):
+        deep = deep + r_id
+    assert deep.compile()(1) == depth + 1
+    assert uc.const(1).compile()(None) == 1
+
+def test_shared_memoized():
+    """Tests that shared sub-Readers are evaluated once per input within a memoized evaluation."""
+    calls = []
+    def func(x):
+        calls.append(x)
+        return x + 1
+    r = Reader(func).shared()
+    reader = r + r * r
+    # not memoized: each occurrence is evaluated
+    assert reader(2) == 12
+    assert calls == [2, 2, 2]
+    calls.clear()
+    memoized = reader.memoized()
+    assert memoized(2) == 12
+    assert calls == [2]
+    # the cache is fresh on each call
+    assert memoized(3) == 20
+    assert memoized(3) == 20
+    assert calls == [2, 3, 3]
+    calls.clear()
+    # a shared Reader called on a different value is re-evaluated
+    reader = (r + r.map(r)).memoized()
+    assert reader(2) == 7
+    assert calls == [2, 3]
+    assert uc.const(1).shared()(None) == 1
+
+def test_cached():
+    """Tests that a cached Reader only calls the wrapped function once per distinct input."""
+    calls = []
+    def func(x):
+        calls.append(x)
+        return x + 1
+    reader = Reader(func).cached()
+    assert [reader(x) for x in [1, 2, 1, 1, 2]] == [2, 3, 2, 2, 3]
+    assert calls == [1, 2]
+    reader = Reader(func).cached(maxsize=1)
+    calls.clear()
+    assert [reader(x) for x in [1, 2, 1]] == [2, 3, 2]
+    assert calls == [1, 2, 1]
+    with pytest.raises(TypeError, match='unhashable'):
+        _ = r_id.cached()([])
 
 def test_bool_operators():
     """Tests that the `bool` and `not` operators return a bool when evaluated on a Reader.
@@ -232,6 +379,103 @@ def test_reader_equality():
     assert (uc.const(1) != uc.const(1)) is True
     assert (uc.const(1) == uc.const(1)) is False
 
+def test_const_cached():
+    """Tests that cached constant Readers are shared for simple immutable values, and distinguished by type."""
+    assert uc.const(1, cached=True) is uc.const(1, cached=True)
+    assert uc.const('a', cached=True) is uc.const('a', cached=True)
+    assert uc.const(None, cached=True) is uc.const(None, cached=True)
+    assert uc.const(1, cached=True) is not uc.const(1)
+    assert uc.const(1, cached=True) is not uc.const(True, cached=True)
+    assert uc.const(True, cached=True)(None) is True
+    assert uc.const(1, cached=True)(None) == 1
+    # floats and containers are not cached
+    assert uc.const(1.0, cached=True) is not uc.const(1.0, cached=True)
+    assert uc.const((1,), cached=True) is not uc.const((1,), cached=True)
+    assert uc.const([1], cached=True)(None) == [1]
+
+def test_const_folding_mutable():
+    """Tests that constant folding does not share mutable outputs between calls."""
+    reader = uc.const([1, 2]).map(list)
+    reader(None).append(3)
+    assert reader(None) == [1, 2]
+    assert not hasattr(reader, '_const_value')
+    reader = uc.const([1]).map_binary(ops.add, uc.const([2]))
+    reader(None).append(3)
+    assert reader(None) == [1, 2]
+    assert uc.const(1.5).map(float)._const_value == 1.5
+    assert uc.const([1]).map(tuple)._const_value == (1,)
+    assert uc.const(1).map(lambda n: (n, ('a', frozenset({2.0}))))._const_value == (1, ('a', frozenset({2.0})))
+    # immutable containers holding mutable elements are not folded
+    tuple_reader = uc.const(2).map(lambda n: ([0] * n,))
+    tuple_reader(None)[0].append(9)
+    assert tuple_reader(None) == ([0, 0],)
+    assert not hasattr(tuple_reader, '_const_value')
+    nested_reader = uc.const(1).map(lambda n: (n, (n, [n])))
+    nested_reader(None)[1][1].append(9)
+    assert nested_reader(None) == (1, (1, [1]))
+    reader = uc.sum([uc.const([1]), uc.const([2])])
+    reader(None).append(99)
+    assert reader(None) == [1, 2]
+    assert not hasattr(reader, '_const_value')
+
+def test_reader_slots():
+    """Tests that Readers store their attributes in slots rather than a per-instance dict."""
+    for reader in [r_square, uc.const(1), r_square.map(add_one), r_square + r_add_one]:
+        assert not hasattr(reader, '__dict__')
+        # Readers can be weakly referenced
+        assert weakref.ref(reader)() is reader
+    reader = uc.const(1)
+    readers = weakref.WeakSet([reader])
+    assert reader in readers
+
+def test_long_map_chain():
+    """Tests that a long chain of map calls is evaluated correctly, with bounded fusion."""
+    reader = r_id
+    for _ in range(1000):
+        reader = reader.map(add_one)
+    assert reader(0) == 1000
+    assert reader.compile()(0) == 1000
+    assert len(reader._node[1]) < 32
+
+@pytest.mark.parametrize('step', [
+    lambda reader: reader.map(abs),
+    lambda reader: reader * uc.const(2),
+    lambda reader: uc.const(1) - reader,
+])
+def test_chain_memory(step):
+    """Tests that building a long chain of Readers retains memory linear (not quadratic) in its length."""
+    def retained(n):
+        tracemalloc.start()
+        try:
+            reader = r_id
+            for _ in range(n):
+                reader = step(reader)
+            return tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+    (small, large) = (retained(1000), retained(8000))
+    # linear growth gives a ratio of about 8, quadratic about 64
+    assert large < 16 * small
+
+def test_const_folding():
+    """Tests that functions mapped onto constant Readers are evaluated eagerly, exactly once."""
+    calls = []
+    def func(x):
+        calls.append(x)
+        return x + 1
+    reader = uc.const(1).map(func).map(func)
+    assert calls == [1, 2]
+    assert reader(None) == 3
+    assert reader(0) == 3
+    assert calls == [1, 2]
+    reader = uc.make_tuple(uc.const(1), uc.const(2)).map_binary(lambda x, y: x + y, uc.const((3,)))
+    assert reader(None) == (1, 2, 3)
+    assert reader._const_value == (1, 2, 3)
+    assert uc.sum([uc.const(1), uc.const(2)], start=3)._const_value == 6
+    assert uc.sum([], start=0)._const_value == 0
+    # errors are deferred until the Reader is called
+    assert not hasattr(uc.sum([]), '_const_value')
+
 def test_invalid_operators():
     """Tests that certain operators are invalid when called on a Reader."""
     type_err = lambda match: pytest.raises(TypeError, match=match)
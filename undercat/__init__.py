@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import builtins
 from collections.abc import Iterable, Sequence
+from contextvars import ContextVar
 from dataclasses import is_dataclass
 import functools
 import operator as ops
@@ -59,7 +60,9 @@ def _getattr_nested(attrs: Sequence[str], type: Optional[type] = None) -> Callab
     # recursively call this function to get a function for the nested accesses
     inner = _getattr_nested(attrs[1:], type=inner_type)
     # left-compose inner with outer
-    return lambda val: inner(outer(val))
+    def _getattr_composed(val: Any, inner: Callable[[Any], Any] = inner, outer: Callable[[Any], Any] = outer) -> Any:
+        return inner(outer(val))
+    return _getattr_composed
 
 
 def _getattr(attr: str, *args: Any, type: Optional[type] = None) -> Callable[[Any], Any]:
@@ -85,6 +88,112 @@ def _make_singleton_tuple(val: S) -> tuple[S]:
     return (val,)
 
 
+def _compose(funcs: tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    """Given a sequence of at least two functions, returns a single function that applies them in order, from left to right.
+    The result is evaluated in one Python frame regardless of the number of functions."""
+    if len(funcs) == 2:
+        (first, second) = funcs
+        def _composed2(val: Any, first: Callable[[Any], Any] = first, second: Callable[[Any], Any] = second) -> Any:
+            return second(first(val))
+        return _composed2
+    def _composed(val: Any, funcs: tuple[Callable[[Any], Any], ...] = funcs) -> Any:
+        for func in funcs:
+            val = func(val)
+        return val
+    return _composed
+
+
+@functools.lru_cache(maxsize=1024)
+def _codegen(names: tuple[str, ...], expr: str, stmts: tuple[str, ...] = ()) -> Callable[..., Callable[[Any], Any]]:
+    """Given a tuple of variable names and a Python expression in terms of those names and `val`, generates (via exec) a factory function.
+    The factory takes values for the named variables and returns a function of `val` that evaluates the expression.
+    Optionally, a sequence of statements (e.g. assignments to local variables) can be provided to execute before evaluating the expression.
+    Factories are cached, so source code is only compiled once per distinct (names, expr, stmts)."""
+    params = ', '.join(names)
+    body = ''.join(f'        {stmt}\n' for stmt in (*stmts, f'return {expr}'))
+    source = f'def _factory({params}):\n    def _generated(val):\n{body}    return _generated\n'
+    namespace: dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace['_factory']  # type: ignore[no-any-return]
+
+
+# binary operators with inline Python syntax, which generated code can use in place of a function call
+_BINARY_OP_SYMBOLS: dict[Callable[[Any, Any], Any], str] = {
+    ops.add: '+',
+    ops.sub: '-',
+    ops.mul: '*',
+    ops.truediv: '/',
+    ops.floordiv: '//',
+    ops.mod: '%',
+    ops.pow: '**',
+    ops.matmul: '@',
+    ops.and_: '&',
+    ops.or_: '|',
+    ops.xor: '^',
+    ops.lt: '<',
+    ops.le: '<=',
+    ops.ge: '>=',
+    ops.gt: '>',
+    ops.eq: '==',
+    ops.ne: '!=',
+}
+
+# unary operators with inline Python syntax (as format strings for the operand expression)
+_UNARY_OP_TEMPLATES: dict[Callable[[Any], Any], str] = {
+    ops.neg: '-{}',
+    ops.pos: '+{}',
+    ops.inv: '~{}',
+    ops.not_: '(not {})',
+    bool: 'bool({})',
+}
+
+# maximum number of terms for which a reduction is unrolled into a single generated expression
+_MAX_UNROLL = 32
+
+# maximum number of functions fused by a chain of map calls (beyond this, a new chain is started, so each map call does constant work)
+_MAX_FUSE = 32
+
+
+def _op_syntax(table: dict[Callable[..., Any], str], operator: Callable[..., Any]) -> Optional[str]:
+    """Given a table of operator syntax and an operator, returns the operator's inline Python syntax, if it has one, otherwise None."""
+    try:
+        return table.get(operator)
+    except TypeError:  # unhashable operator
+        return None
+
+
+# node types recording how a Reader was constructed from other Readers (used by Reader.compile)
+_MAP = 0  # (_MAP, func, reader)
+_BINARY = 1  # (_BINARY, operator, left_reader, right_reader)
+_TUPLE = 2  # (_TUPLE, readers)
+_MAP_CHAIN = 3  # (_MAP_CHAIN, funcs, reader), for a chain of map calls applying funcs in order (intermediate Readers are not referenced)
+
+
+# cache of (input, output) pairs for shared Readers, active only during the evaluation of a memoized Reader
+_shared_cache: ContextVar[Optional[dict[object, tuple[Any, Any]]]] = ContextVar('_shared_cache', default=None)
+
+
+# types whose instances can be safely interned by const(..., cached=True) (equal values are interchangeable)
+_CACHEABLE_CONST_TYPES = (bool, int, str, bytes, type(None))
+
+# scalar types of immutable values, which constant folding may return from every call (a mutable result must be computed afresh on each call)
+_IMMUTABLE_SCALAR_TYPES = (*_CACHEABLE_CONST_TYPES, float)
+
+
+def _is_immutable(val: Any) -> bool:
+    """Returns True if the value is an immutable scalar, or a tuple or frozenset whose elements are (recursively) immutable."""
+    if type(val) in _IMMUTABLE_SCALAR_TYPES:
+        return True
+    if type(val) in (tuple, frozenset):
+        return builtins.all(_is_immutable(elt) for elt in val)
+    return False
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
+def _cached_const(val: Any) -> Reader[Any, Any]:
+    return Reader.const(val)
+
+
 ##########
 # READER #
 ##########
@@ -92,13 +201,42 @@ def _make_singleton_tuple(val: S) -> tuple[S]:
 class Reader(Generic[S, A]):
     """Class that wraps a function func : S -> A."""
 
+    # use slots rather than a per-instance dict, for smaller instances and faster attribute access
+    # (__weakref__ is included so that Readers can still be weakly referenced, e.g. as WeakKeyDictionary keys)
+    __slots__ = ('func', '_const_value', '_node', '__weakref__')
+
+    # for Readers produced by const, the constant value
+    _const_value: Any
+    # for Readers produced from other Readers, a node describing the construction (see Reader.compile)
+    _node: tuple[Any, ...]
+
     def __init__(self, func: Callable[[S], A]) -> None:
         self.func = func
 
     @classmethod
-    def const(cls, val: A) -> Reader[S, A]:
-        """Given a value, returns a Reader that is a constant function returning that value."""
-        return Reader(lambda _: val)
+    def const(cls, val: A, cached: bool = False) -> Reader[S, A]:
+        """Given a value, returns a Reader that is a constant function returning that value.
+        If cached=True and the value is a bool, int, str, bytes, or None, returns a shared Reader instance for that value (so repeated calls do not allocate new Readers)."""
+        if cached and (type(val) in _CACHEABLE_CONST_TYPES):
+            return _cached_const(val)
+        def _const(_: S, val: A = val) -> A:
+            return val
+        reader: Reader[S, A] = Reader(_const)
+        reader._const_value = val
+        return reader
+
+    @classmethod
+    def _fold(cls, func: Callable[..., B], *vals: Any) -> Optional[Reader[Any, B]]:
+        """Given a function and the constant values of one or more Readers, attempts to evaluate the function eagerly, returning a constant Reader.
+        If the evaluation raises an error, returns None, so that the error is instead raised whenever the Reader is called.
+        Also returns None if the result is not (deeply) immutable, since then each call should produce a fresh object."""
+        try:
+            result = func(*vals)
+        except Exception:
+            return None
+        if _is_immutable(result):
+            return Reader.const(result)
+        return None
 
     @classmethod
     def make_tuple(cls, *readers: Reader[S, A]) -> Reader[S, tuple[A, ...]]:
@@ -107,21 +245,85 @@ class Reader(Generic[S, A]):
             return Reader.const(())
         if len(readers) == 1:
             return readers[0].map(_make_singleton_tuple)
-        return Reader(lambda val: tuple(reader(val) for reader in readers))
+        if builtins.all(hasattr(reader, '_const_value') for reader in readers):
+            return Reader.const(tuple(reader._const_value for reader in readers))
+        # generate a function specialized to the number of Readers, which calls each wrapped function directly
+        names = tuple(f'f{i}' for i in range(len(readers)))
+        expr = '(' + ', '.join(f'{name}(val)' for name in names) + ')'
+        reader: Reader[S, tuple[A, ...]] = Reader(_codegen(names, expr)(*(reader.func for reader in readers)))
+        reader._node = (_TUPLE, readers)
+        return reader
 
     def __call__(self, val: S) -> A:
         """Calls the wrapped function.
-        NOTE: subclasses should not override this directly, but instead modify the wrapped function itself."""
+        NOTE: subclasses should not override this directly, but instead modify the wrapped function itself.
+        In performance-critical loops, the wrapped function `reader.func` can be bound once and called directly, avoiding the Python-level frame of this method (see also `batch`)."""
         return self.func(val)
 
+    def batch(self, vals: Iterable[S]) -> list[A]:
+        """Calls the wrapped function on each of multiple input values, returning a list of outputs.
+        The loop runs at C level (via the builtin `map`), with no Reader.__call__ overhead per value.
+        NOTE: a Reader built only from the binary arithmetic and comparison operators (e.g. +, *, <) can be called directly on a NumPy array, evaluating elementwise.
+        This does not hold for operations that take the truth value of an output, such as `falsy`, `not_equals`, `uc.all`, and `uc.any`."""
+        return list(builtins.map(self.func, vals))
+
     def map(self, func: Callable[[A], B]) -> Reader[S, B]:
-        """Left-composes a function onto the wrapped function, returning a new Reader."""
-        inner = self.func
-        return Reader(lambda val: func(inner(val)))
+        """Left-composes a function onto the wrapped function, returning a new Reader.
+        Chains of map calls are fused into composite functions of up to _MAX_FUSE functions each, rather than nested closures.
+        If this Reader is constant, the function is applied eagerly (once) and a new constant Reader is returned."""
+        if hasattr(self, '_const_value') and (folded := Reader._fold(func, self._const_value)) is not None:
+            return folded
+        # extend this Reader's map chain, if it has one with room left (sharing its base Reader rather than referencing this one)
+        node = getattr(self, '_node', None)
+        if (node is not None) and (node[0] == _MAP_CHAIN) and (len(node[1]) < _MAX_FUSE - 1):
+            (_, prev_funcs, base) = node
+            funcs = (*prev_funcs, func)
+        else:
+            (funcs, base) = ((func,), self)
+        reader: Reader[S, B] = Reader(_compose((base.func, *funcs)))
+        reader._node = (_MAP_CHAIN, funcs, base)
+        return reader
+
+    def _map_direct(self, func: Callable[[A], B], names: tuple[str, ...], expr: str, *args: Any) -> Reader[S, B]:
+        """Equivalent to self.map(func), but rather than a generic composition, generates a function evaluating the given expression.
+        The expression is in terms of `func(val)` (the output of this Reader's wrapped function) and the given names, whose values are provided as additional arguments."""
+        if hasattr(self, '_const_value'):
+            return self.map(func)
+        reader: Reader[S, B] = Reader(_codegen(('func', *names), expr)(self.func, *args))
+        reader._node = (_MAP, func, self)
+        return reader
+
+    def _map_unary(self, operator: Callable[[A], B]) -> Reader[S, B]:
+        """Equivalent to self.map(operator), for a unary operator with inline syntax.
+        Generates a function applying the operator directly to the wrapped function's output, e.g. -func(val)."""
+        return self._map_direct(operator, (), _UNARY_OP_TEMPLATES[operator].format('func(val)'))
 
     def map_binary(self, operator: Callable[[A, A], B], other: Reader[S, A]) -> Reader[S, B]:
-        """Given a binary operator and another Reader, returns a new Reader that applies the operator to the output of this Reader and the other Reader."""
-        return Reader(lambda val: operator(self(val), other(val)))
+        """Given a binary operator and another Reader, returns a new Reader that applies the operator to the output of this Reader and the other Reader.
+        If either Reader is constant, its value is bound in advance (and if both are, the operator is applied eagerly)."""
+        (self_const, other_const) = (hasattr(self, '_const_value'), hasattr(other, '_const_value'))
+        if self_const and other_const and ((folded := Reader._fold(operator, self._const_value, other._const_value)) is not None):
+            return folded
+        # with one constant side, the result is a map (extending any map chain), so it does not reference this Reader or the other
+        if self_const and (not other_const):
+            def _bind_left(val: A, op: Callable[[A, A], B] = operator, left: A = self._const_value) -> B:
+                return op(left, val)
+            return other.map(_bind_left)
+        if other_const and (not self_const):
+            def _bind_right(val: A, op: Callable[[A, A], B] = operator, right: A = other._const_value) -> B:
+                return op(val, right)
+            return self.map(_bind_right)
+        reader: Reader[S, B]
+        if (symbol := _op_syntax(_BINARY_OP_SYMBOLS, operator)) is not None:
+            # generate a function applying the operator's syntax directly, e.g. left(val) < right(val)
+            reader = Reader(_codegen(('left', 'right'), f'left(val) {symbol} right(val)')(self.func, other.func))
+        else:
+            # bind the operator and the wrapped functions as default arguments (fast local lookups), bypassing Reader.__call__
+            def _binary(val: S, op: Callable[[A, A], B] = operator, left: Callable[[S], A] = self.func, right: Callable[[S], A] = other.func) -> B:
+                return op(left(val), right(val))
+            reader = Reader(_binary)
+        reader._node = (_BINARY, operator, self, other)
+        return reader
 
     # ARITHMETIC OPERATORS
 
@@ -150,13 +352,13 @@ class Reader(Generic[S, A]):
         return self.map_binary(ops.matmul, other)
 
     def __neg__(self) -> Reader[S, A]:
-        return self.map(ops.neg)  # type: ignore[arg-type]
+        return self._map_unary(ops.neg)  # type: ignore[arg-type]
 
     def __pos__(self) -> Reader[S, A]:
-        return self.map(ops.pos)  # type: ignore[arg-type]
+        return self._map_unary(ops.pos)  # type: ignore[arg-type]
 
     def __invert__(self) -> Reader[S, A]:
-        return self.map(ops.inv)  # type: ignore[arg-type]
+        return self._map_unary(ops.inv)  # type: ignore[arg-type]
 
     # LOGICAL OPERATORS
 
@@ -171,11 +373,11 @@ class Reader(Generic[S, A]):
 
     def truthy(self) -> Reader[S, bool]:
         """Returns a Reader that evaluates the `bool` function on this Reader's output."""
-        return self.map(bool)
+        return self._map_unary(bool)
 
     def falsy(self) -> Reader[S, bool]:
         """Returns a Reader that evaluates the logical negation (`not` operator) on this Reader's output."""
-        return self.map(ops.not_)
+        return self._map_unary(ops.not_)
 
     # COMPARISON OPERATORS
 
@@ -203,11 +405,13 @@ class Reader(Generic[S, A]):
 
     def contains(self, element: Any) -> Reader[S, bool]:
         """Returns a Reader returning True if the given element is in the value returned by this Reader."""
-        return self.map(lambda val: element in val)  # type: ignore[operator]
+        def _contains(val: A, element: Any = element) -> bool:
+            return element in val  # type: ignore[operator]
+        return self._map_direct(_contains, ('element',), 'element in func(val)', element)
 
     def getitem(self, index: Any) -> Reader[S, Any]:
         """Returns a Reader that returns value[index], where value is the value returned by this Reader."""
-        return self.map(ops.itemgetter(index))  # type: ignore[arg-type]
+        return self._map_direct(ops.itemgetter(index), ('index',), 'func(val)[index]', index)  # type: ignore[arg-type]
 
     def getattr(self, attr: str, *args: Any, type: Optional[type] = None) -> Reader[S, Any]:
         """Returns a Reader that returns getattr(value, attr, [default]), where value is the value returned by this Reader.
@@ -215,15 +419,135 @@ class Reader(Generic[S, A]):
         The second argument to this method, if present, is the default value to use if an attribute does not exist."""
         return self.map(_getattr(attr, *args, type=type))
 
+    # COMPILATION
+
+    def compile(self) -> Reader[S, A]:
+        """Returns an equivalent Reader whose wrapped function is generated as a single flat sequence of statements.
+        The tree of Readers built via map, make_tuple, and the unary/binary operators is linearized (in post-order) into one assignment per node, e.g.:
+            v0 = f0(val)
+            v1 = v0 + c0
+            v2 = -v1
+        so that each call takes a constant number of Python frames regardless of the depth of the tree (any other Readers are called as opaque functions).
+        A sub-Reader occurring multiple times in the tree is only evaluated once per call."""
+        if hasattr(self, '_const_value'):
+            return self
+        names: list[str] = []
+        vals: list[Any] = []
+        stmts: list[str] = []
+        # map from Reader ids to the expressions for their outputs (the Readers themselves are kept alive by the tree)
+        exprs: dict[int, str] = {}
+        def bind(val: Any) -> str:
+            names.append(f'c{len(names)}')
+            vals.append(val)
+            return names[-1]
+        def children(reader: Reader[Any, Any]) -> Sequence[Reader[Any, Any]]:
+            node = getattr(reader, '_node', None)
+            if hasattr(reader, '_const_value') or (node is None):
+                return ()
+            if node[0] in (_MAP, _MAP_CHAIN):
+                return (node[2],)
+            if node[0] == _BINARY:
+                return (node[2], node[3])
+            return node[1]  # type: ignore[no-any-return]
+        def assign(expr: str) -> str:
+            var = f'v{len(stmts)}'
+            stmts.append(f'{var} = {expr}')
+            return var
+        def apply(func: Callable[[Any], Any], arg: str) -> str:
+            if (template := _op_syntax(_UNARY_OP_TEMPLATES, func)) is not None:
+                return template.format(arg)
+            return f'{bind(func)}({arg})'
+        def emit(reader: Reader[Any, Any]) -> str:
+            # all of the Reader's children have already been emitted
+            if hasattr(reader, '_const_value'):
+                return bind(reader._const_value)
+            node = getattr(reader, '_node', None)
+            if node is None:
+                expr = f'{bind(reader.func)}(val)'
+            elif node[0] == _MAP:
+                (_, func, inner) = node
+                expr = apply(func, exprs[id(inner)])
+            elif node[0] == _MAP_CHAIN:
+                # one statement per function in the chain
+                (_, funcs, inner) = node
+                expr = exprs[id(inner)]
+                for func in funcs[:-1]:
+                    expr = assign(apply(func, expr))
+                expr = apply(funcs[-1], expr)
+            elif node[0] == _BINARY:
+                (_, operator, left, right) = node
+                (left_expr, right_expr) = (exprs[id(left)], exprs[id(right)])
+                if (symbol := _op_syntax(_BINARY_OP_SYMBOLS, operator)) is not None:
+                    expr = f'{left_expr} {symbol} {right_expr}'
+                else:
+                    expr = f'{bind(operator)}({left_expr}, {right_expr})'
+            else:  # _TUPLE
+                expr = '(' + ''.join(f'{exprs[id(inner)]}, ' for inner in node[1]) + ')'
+            return assign(expr)
+        # post-order traversal with an explicit stack (rather than recursion, so that arbitrarily deep trees can be compiled)
+        # each entry is a Reader and a flag indicating whether its children have already been pushed
+        stack: list[tuple[Reader[Any, Any], bool]] = [(self, False)]
+        while stack:
+            (reader, expanded) = stack.pop()
+            if id(reader) in exprs:
+                continue
+            if expanded:
+                exprs[id(reader)] = emit(reader)
+            else:
+                stack.append((reader, True))
+                # push children in reverse so that they are emitted from left to right
+                stack.extend((child, False) for child in reversed(children(reader)))
+        expr = exprs[id(self)]
+        return Reader(_codegen(tuple(names), expr, tuple(stmts))(*vals))
+
+    # MEMOIZATION
+
+    def shared(self) -> Reader[S, A]:
+        """Returns an equivalent Reader whose output is cached while evaluating a memoized Reader (see `memoized`).
+        This is useful when the same sub-Reader occurs multiple times in an expression: for example, in `(r + r * r).memoized()` where `r = expensive.shared()`, `expensive` is only called once per input.
+        Outside of a memoized evaluation, the shared Reader simply calls the wrapped function."""
+        if hasattr(self, '_const_value'):  # nothing to cache
+            return self
+        def _shared(val: S, func: Callable[[S], A] = self.func, key: object = object()) -> A:
+            cache = _shared_cache.get()
+            if cache is None:
+                return func(val)
+            # the input is checked by identity, since a shared Reader may also be called on other values (e.g. if it is mapped onto a Reader's output)
+            if ((entry := cache.get(key)) is not None) and (entry[0] is val):
+                return entry[1]  # type: ignore[no-any-return]
+            result = func(val)
+            cache[key] = (val, result)
+            return result
+        return Reader(_shared)
+
+    def memoized(self) -> Reader[S, A]:
+        """Returns an equivalent Reader which, on each call, evaluates this Reader with a fresh cache for its shared sub-Readers (see `shared`)."""
+        def _memoized(val: S, func: Callable[[S], A] = self.func) -> A:
+            token = _shared_cache.set({})
+            try:
+                return func(val)
+            finally:
+                _shared_cache.reset(token)
+        return Reader(_memoized)
+
+    def cached(self, maxsize: Optional[int] = 128) -> Reader[S, A]:
+        """Returns an equivalent Reader that caches the outputs of the wrapped function across calls, using an LRU cache of the given size (unbounded if maxsize=None).
+        This is useful when the same (expensive) Reader is called repeatedly on equal inputs.
+        NOTE: inputs must be hashable."""
+        if hasattr(self, '_const_value'):  # nothing to cache
+            return self
+        return Reader(functools.lru_cache(maxsize=maxsize)(self.func))
+
 
 #######################
 # READER CONSTRUCTORS #
 #######################
 
 
-def const(val: A) -> Reader[S, A]:
-    """Given a value, returns a Reader that is a constant function returning that value."""
-    return Reader.const(val)
+def const(val: A, cached: bool = False) -> Reader[S, A]:
+    """Given a value, returns a Reader that is a constant function returning that value.
+    If cached=True and the value is a bool, int, str, bytes, or None, returns a shared Reader instance for that value (so repeated calls do not allocate new Readers)."""
+    return Reader.const(val, cached=cached)
 
 
 def make_tuple(*readers: Reader[S, A]) -> Reader[S, tuple[A, ...]]:
@@ -256,21 +580,70 @@ def map(func: Callable[[A], B], reader: Reader[S, A]) -> Reader[S, B]:  # noqa:
 def reduce(readers: Iterable[Reader[S, A]], operator: Callable[[A, A], A], initial: Optional[A] = None) -> Reader[S, A]:
     """Given a sequence of Readers and a binary operator, produces a new Reader that reduces the operator over the values produced by the input Readers.
     An initial value can optionally be provided to handle the case where an empty sequence is acted on."""
+    # materialize the Readers once (the input may be a single-use iterable)
+    readers = tuple(readers)
+    if builtins.all(hasattr(reader, '_const_value') for reader in readers):
+        # fold to a constant (only if the result is immutable, so mutable results are still built afresh on each call)
+        vals = tuple(reader._const_value for reader in readers)
+        fold_args = (vals,) if (initial is None) else (vals, initial)
+        if (folded := Reader._fold(functools.reduce, operator, *fold_args)) is not None:
+            return folded
+    # accumulate each Reader's output as it is produced, rather than building an intermediate tuple
+    # (the operator, functions, and initial value are bound as default arguments, for fast local lookups)
+    funcs = tuple(reader.func for reader in readers)
+    if ((symbol := _op_syntax(_BINARY_OP_SYMBOLS, operator)) is not None) and (len(funcs) <= _MAX_UNROLL):
+        # unroll the reduction into a single expression using the operator's syntax, e.g. ((f0(val) + f1(val)) + f2(val))
+        names = tuple(f'f{i}' for i in range(len(funcs)))
+        terms = [f'{name}(val)' for name in names]
+        args: tuple[Any, ...] = funcs
+        if initial is not None:
+            (names, terms, args) = (('initial', *names), ['initial', *terms], (initial, *funcs))
+        if terms:
+            expr = terms[0]
+            for term in terms[1:]:
+                expr = f'({expr} {symbol} {term})'
+            return Reader(_codegen(names, expr)(*args))
     if initial is None:
-        func = functools.partial(functools.reduce, operator)
-    else:
-        func = lambda iterable: functools.reduce(operator, iterable, initial)  # type: ignore[assignment]
-    return make_tuple(*readers).map(func)
+        if not funcs:
+            def _reduce_empty(val: S) -> A:
+                raise TypeError('reduce() of empty iterable with no initial value')
+            return Reader(_reduce_empty)
+        def _reduce(val: S, op: Callable[[A, A], A] = operator, first: Callable[[S], A] = funcs[0], rest: tuple[Callable[[S], A], ...] = funcs[1:]) -> A:
+            acc = first(val)
+            for func in rest:
+                acc = op(acc, func(val))
+            return acc
+        return Reader(_reduce)
+    def _reduce_initial(val: S, op: Callable[[A, A], A] = operator, funcs: tuple[Callable[[S], A], ...] = funcs, initial: A = initial) -> A:
+        acc = initial
+        for func in funcs:
+            acc = op(acc, func(val))
+        return acc
+    return Reader(_reduce_initial)
 
 
 def all(readers: Iterable[Reader[S, A]]) -> Reader[S, bool]:  # noqa: A001
-    """Given a sequence of Readers, produces a new Reader that evaluates the `all` function over the values output by the Readers."""
-    return reduce(readers, ops.and_, initial=True)  # type: ignore[arg-type]
+    """Given a sequence of Readers, produces a new Reader that evaluates the `all` function over the values output by the Readers.
+    Evaluation short-circuits: Readers after the first one producing a falsy value are not called."""
+    funcs = tuple(reader.func for reader in readers)
+    def _all(val: S, funcs: tuple[Callable[[S], A], ...] = funcs) -> bool:
+        for func in funcs:
+            if not func(val):
+                return False
+        return True
+    return Reader(_all)
 
 
 def any(readers: Iterable[Reader[S, A]]) -> Reader[S, bool]:  # noqa: A001
-    """Given a sequence of Readers, produces a new Reader that evaluates the `any` function over the values output by the Readers."""
-    return reduce(readers, ops.or_, initial=False)  # type: ignore[arg-type]
+    """Given a sequence of Readers, produces a new Reader that evaluates the `any` function over the values output by the Readers.
+    Evaluation short-circuits: Readers after the first one producing a truthy value are not called."""
+    funcs = tuple(reader.func for reader in readers)
+    def _any(val: S, funcs: tuple[Callable[[S], A], ...] = funcs) -> bool:
+        for func in funcs:
+            if func(val):
+                return True
+        return False
+    return Reader(_any)
 
 
 def sum(readers: Iterable[Reader[S, A]], start: Optional[A] = None) -> Reader[S, A]:  # noqa: A001